@@ -0,0 +1,41 @@
+VALID_ESTATE_TYPES = frozenset({"byty", "domy"})
+
+VALID_REGIONS = frozenset(
+    {
+        "praha",
+        "jihocesky-kraj",
+        "jihomoravsky-kraj",
+        "karlovarsky-kraj",
+        "kralovehradecky-kraj",
+        "liberecky-kraj",
+        "moravskoslezsky-kraj",
+        "olomoucky-kraj",
+        "pardubicky-kraj",
+        "plzensky-kraj",
+        "stredocesky-kraj",
+        "ustecky-kraj",
+        "vysocina",
+        "zlinsky-kraj",
+    }
+)
+
+VALID_FLAT_TYPES = frozenset(
+    {
+        "1+kk",
+        "1+1",
+        "2+kk",
+        "2+1",
+        "3+kk",
+        "3+1",
+        "4+kk",
+        "4+1",
+        "5+kk",
+        "5+1",
+        "6 a více",
+        "Atypický",
+    }
+)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+}
@@ -1,57 +1,86 @@
+import asyncio
 import logging
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+import csv
+import multiprocessing
+import os
 import sys
 import re
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional
+from operator import attrgetter
+from typing import Callable, List, Dict, Optional, Tuple
+
+from constants import HEADERS, VALID_ESTATE_TYPES, VALID_FLAT_TYPES, VALID_REGIONS
 
 # Configure logging
 logging.basicConfig(
     level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s"
 )
-
-THREAD_COUNT = 10
-
-VALID_ESTATE_TYPES = ["byty", "domy"]
-
-VALID_REGIONS = [
-    "praha",
-    "jihocesky-kraj",
-    "jihomoravsky-kraj",
-    "karlovarsky-kraj",
-    "kralovehradecky-kraj",
-    "liberecky-kraj",
-    "moravskoslezsky-kraj",
-    "olomoucky-kraj",
-    "pardubicky-kraj",
-    "plzensky-kraj",
-    "stredocesky-kraj",
-    "ustecky-kraj",
-    "vysocina",
-    "zlinsky-kraj",
-]
-
-VALID_FLAT_TYPES = [
-    "1+kk",
-    "1+1",
-    "2+kk",
-    "2+1",
-    "3+kk",
-    "3+1",
-    "4+kk",
-    "4+1",
-    "5+kk",
-    "5+1",
-    "6 a více",
-    "Atypický",
-]
-
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-}
+logger = logging.getLogger(__name__)
+
+CONNECTION_LIMIT = 50
+REQUEST_TIMEOUT = 10
+KEEPALIVE_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+DETAILS_CACHE_SIZE = 4096
+PAGE_BATCH_SIZE = 5
+
+
+@dataclass(slots=True)
+class HouseListing:
+    """A scraped house listing. Fields are in CSV column order."""
+
+    title: str = field(metadata={"column": "Title"})
+    property_type: str = field(metadata={"column": "Property Type"})
+    usable_area: Optional[int] = field(metadata={"column": "Usable Area (m²)"})
+    land_size: Optional[int] = field(metadata={"column": "Land Size (m²)"})
+    location: str = field(metadata={"column": "Location"})
+    region: Optional[str] = field(metadata={"column": "Region"})
+    district: Optional[str] = field(metadata={"column": "District"})
+    city: Optional[str] = field(metadata={"column": "City"})
+    energy_rank: Optional[str] = field(metadata={"column": "Energy Rank"})
+    price: Optional[int] = field(metadata={"column": "Price (CZK)"})
+    url: str = field(metadata={"column": "URL"})
+    image: str = field(metadata={"column": "Image"})
+
+
+@dataclass(slots=True)
+class FlatListing:
+    """A scraped flat listing. Fields are in CSV column order."""
+
+    title: str = field(metadata={"column": "Title"})
+    property_type: str = field(metadata={"column": "Property Type"})
+    usable_area: Optional[int] = field(metadata={"column": "Usable Area (m²)"})
+    flat_type: Optional[str] = field(metadata={"column": "Flat Type"})
+    location: str = field(metadata={"column": "Location"})
+    region: Optional[str] = field(metadata={"column": "Region"})
+    district: Optional[str] = field(metadata={"column": "District"})
+    city: Optional[str] = field(metadata={"column": "City"})
+    energy_rank: Optional[str] = field(metadata={"column": "Energy Rank"})
+    price: Optional[int] = field(metadata={"column": "Price (CZK)"})
+    url: str = field(metadata={"column": "URL"})
+    image: str = field(metadata={"column": "Image"})
+
+
+Listing = HouseListing | FlatListing
+
+# Listing URL -> task resolving to its extracted details
+_details_cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+_HOUSE_AREA_RE = re.compile(r"(\d+)\s*m².*?pozemek\s*(\d+)\s*m²")
+_FLAT_AREA_RE = re.compile(r"(\d+)\s*m²")
+# Longest alternatives first so a flat type is never cut short by a shorter prefix
+_FLAT_TYPE_RE = re.compile(
+    "|".join(
+        re.escape(ftype)
+        for ftype in sorted(VALID_FLAT_TYPES, key=lambda ftype: (-len(ftype), ftype))
+    )
+)
 
 
 def validate_args(estate_type: str, region: str, pages: str):
@@ -69,26 +98,29 @@ def validate_args(estate_type: str, region: str, pages: str):
     Raises:
         ValueError: If the estate type is invalid, region is invalid, or pages is not a positive integer.
     """
-    logging.info(
-        f"Validating arguments: estate_type={estate_type}, region={region}, pages={pages}"
+    logger.info(
+        "Validating arguments: estate_type=%s, region=%s, pages=%s",
+        estate_type,
+        region,
+        pages,
     )
     if estate_type not in VALID_ESTATE_TYPES:
-        logging.error(f"Invalid estate type: {estate_type}")
+        logger.error("Invalid estate type: %s", estate_type)
         raise ValueError(
-            f"Invalid estate type: {estate_type}. Allowed: {VALID_ESTATE_TYPES}"
+            f"Invalid estate type: {estate_type}. Allowed: {sorted(VALID_ESTATE_TYPES)}"
         )
 
     if region != "all" and region not in VALID_REGIONS:
-        logging.error(f"Invalid region: {region}")
+        logger.error("Invalid region: %s", region)
         raise ValueError(
-            f"Invalid region: {region}. Allowed: {VALID_REGIONS} or 'all'."
+            f"Invalid region: {region}. Allowed: {sorted(VALID_REGIONS)} or 'all'."
         )
 
     if not pages.isdigit() or int(pages) <= 0:
-        logging.error(f"Invalid pages parameter: {pages}")
+        logger.error("Invalid pages parameter: %s", pages)
         raise ValueError(f"Pages must be a positive integer, got: {pages}")
 
-    logging.info("Arguments validated successfully.")
+    logger.info("Arguments validated successfully.")
     return estate_type, region, int(pages)
 
 
@@ -102,47 +134,82 @@ def clean_price(price_text: str) -> Optional[int]:
     Returns:
         Optional[int]: The extracted price as an integer if found, otherwise None.
     """
-    logging.debug(f"Cleaning price from text: {price_text}")
-    price_numbers = re.findall(r"\d+", price_text)
-    result = int("".join(price_numbers)) if price_numbers else None
-    logging.debug(f"Extracted price: {result}")
+    logger.debug("Cleaning price from text: %s", price_text)
+    digits = "".join(filter(str.isdecimal, price_text))
+    result = int(digits) if digits else None
+    logger.debug("Extracted price: %s", result)
     return result
 
 
-def extract_listing_details(url: str) -> Dict[str, Optional[str]]:
+async def fetch_html(session: aiohttp.ClientSession, url: str) -> Tuple[int, str]:
+    """
+    Fetches a page over the shared session, retrying connection failures and timeouts.
+
+    Parameters:
+        session (aiohttp.ClientSession): The HTTP session used for the request.
+        url (str): URL of the page to fetch.
+
+    Returns:
+        Tuple[int, str]: The HTTP status code and the page body (empty unless the status is 200).
+
+    Raises:
+        aiohttp.ClientConnectionError, asyncio.TimeoutError: If the last retry fails as well.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return response.status, ""
+                return response.status, await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = RETRY_BACKOFF * 2**attempt
+            logger.warning("Request to %s failed (%r); retrying in %ss", url, e, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def fetch_listing_details(
+    session: aiohttp.ClientSession, url: str
+) -> Optional[Dict[str, Optional[str]]]:
     """
     Fetches additional details from an individual listing page.
 
     Parameters:
+        session (aiohttp.ClientSession): The HTTP session used for the request.
         url (str): URL of the listing page.
 
     Returns:
-        Dict[str, Optional[str]]: A dictionary with keys "Region", "District", "City", "Energy Rank".
-                                  Each value is a string if available, or None if not.
+        Optional[Dict[str, Optional[str]]]: A dictionary with keys "Region", "District", "City",
+                                            "Energy Rank", each a string if available or None if
+                                            not; None if the page could not be retrieved.
     """
-    logging.info(f"Extracting listing details from URL: {url}")
-    response = requests.get(url, headers=HEADERS)
-    if response.status_code != 200:
-        logging.error(
-            f"Failed to retrieve listing details. Status Code: {response.status_code} for URL: {url}"
+    logger.info("Extracting listing details from URL: %s", url)
+    status, html = await fetch_html(session, url)
+    if status != 200:
+        logger.error(
+            "Failed to retrieve listing details. Status Code: %s for URL: %s",
+            status,
+            url,
         )
-        return {"District": None, "Region": None, "City": None, "Energy Rank": None}
+        return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Both fields live in the scroll content, so resolve it once and query inside it
+    content = LexborHTMLParser(html).css_first("#userweb-map-layout-scroll-content")
 
     # Extract location breadcrumbs
-    breadcrumbs = soup.select("#userweb-map-layout-scroll-content nav ol li a")
-    location_parts = [crumb.text.strip() for crumb in breadcrumbs]
+    breadcrumbs = content.css("nav ol li a") if content else []
+    location_parts = [crumb.text().strip() for crumb in breadcrumbs]
 
     region = location_parts[3] if len(location_parts) > 3 else None
     district = location_parts[4] if len(location_parts) > 4 else None
     city = location_parts[5] if len(location_parts) > 5 else None
 
     # Extract energy efficiency rating
-    energy_rank_tag = soup.select_one(
-        "#userweb-map-layout-scroll-content p.css-1sdpd03"
-    )
-    energy_rank = energy_rank_tag.text.strip() if energy_rank_tag else None
+    energy_rank_tag = content.css_first("p.css-1sdpd03") if content else None
+    energy_rank = energy_rank_tag.text().strip() if energy_rank_tag else None
 
     details = {
         "Region": region,
@@ -150,17 +217,66 @@ def extract_listing_details(url: str) -> Dict[str, Optional[str]]:
         "City": city,
         "Energy Rank": energy_rank,
     }
-    logging.debug(f"Extracted details: {details}")
+    logger.debug("Extracted details: %s", details)
     return details
 
 
-def parse_house(
-    title: str, location: str, price: int, link: str, image_url: str
-) -> Dict[str, str | int]:
+async def extract_listing_details(
+    session: aiohttp.ClientSession, url: str
+) -> Dict[str, Optional[str]]:
+    """
+    Returns the details of a listing page, fetching each URL at most once.
+
+    Results are kept in an LRU cache of DETAILS_CACHE_SIZE URLs. Concurrent calls
+    for the same URL share a single in-flight fetch. Fetches that raise, are cancelled
+    or get a non-200 response are not cached, so a later call retries them.
+
+    Parameters:
+        session (aiohttp.ClientSession): The HTTP session used for the request.
+        url (str): URL of the listing page.
+
+    Returns:
+        Dict[str, Optional[str]]: A dictionary with keys "Region", "District", "City", "Energy Rank".
+                                  Each value is a string if available, or None if not.
+    """
+    task = _details_cache.get(url)
+    if task is None:
+        task = asyncio.ensure_future(fetch_listing_details(session, url))
+        _details_cache[url] = task
+        if len(_details_cache) > DETAILS_CACHE_SIZE:
+            _details_cache.popitem(last=False)
+    else:
+        logger.debug("Listing details cache hit for URL: %s", url)
+        _details_cache.move_to_end(url)
+
+    try:
+        # Shielded so that cancelling one caller doesn't cancel the fetch for the others
+        details = await asyncio.shield(task)
+    except BaseException:
+        if task.done() and _details_cache.get(url) is task:
+            del _details_cache[url]
+        raise
+
+    if details is None:
+        if _details_cache.get(url) is task:
+            del _details_cache[url]
+        return {"District": None, "Region": None, "City": None, "Energy Rank": None}
+    return dict(details)
+
+
+async def parse_house(
+    session: aiohttp.ClientSession,
+    title: str,
+    location: str,
+    price: int,
+    link: str,
+    image_url: str,
+) -> HouseListing:
     """
     Parses a house listing to extract relevant details.
 
     Parameters:
+        session (aiohttp.ClientSession): The HTTP session used to fetch listing details.
         title (str): The title of the listing, which may include area details.
         location (str): The location information from the listing.
         price (int): The price of the house.
@@ -168,41 +284,47 @@ def parse_house(
         image_url (str): URL of the listing image.
 
     Returns:
-        Dict[str, str | int]: A dictionary containing parsed details of the house listing.
+        HouseListing: The parsed details of the house listing.
     """
-    logging.info(f"Parsing house listing with title: {title}")
-    match = re.search(r"(\d+)\s*m².*?pozemek\s*(\d+)\s*m²", title)
+    logger.info("Parsing house listing with title: %s", title)
+    match = _HOUSE_AREA_RE.search(title)
     usable_area = int(match.group(1)) if match else None
     land_size = int(match.group(2)) if match else None
 
     # Fetch additional details
-    extra_details = extract_listing_details(link)
-
-    parsed = {
-        "Title": title,
-        "Property Type": "House",
-        "Usable Area (m²)": usable_area,
-        "Land Size (m²)": land_size,
-        "Location": location,
-        "Region": extra_details["Region"],
-        "District": extra_details["District"],
-        "City": extra_details["City"],
-        "Energy Rank": extra_details["Energy Rank"],
-        "Price (CZK)": price,
-        "URL": link,
-        "Image": image_url,
-    }
-    logging.debug(f"Parsed house listing: {parsed}")
+    extra_details = await extract_listing_details(session, link)
+
+    parsed = HouseListing(
+        title=title,
+        property_type="House",
+        usable_area=usable_area,
+        land_size=land_size,
+        location=location,
+        region=extra_details["Region"],
+        district=extra_details["District"],
+        city=extra_details["City"],
+        energy_rank=extra_details["Energy Rank"],
+        price=price,
+        url=link,
+        image=image_url,
+    )
+    logger.debug("Parsed house listing: %s", parsed)
     return parsed
 
 
-def parse_flat(
-    title: str, location: str, price: int, link: str, image_url: str
-) -> Dict[str, str | int]:
+async def parse_flat(
+    session: aiohttp.ClientSession,
+    title: str,
+    location: str,
+    price: int,
+    link: str,
+    image_url: str,
+) -> FlatListing:
     """
     Parses a flat listing to extract relevant details.
 
     Parameters:
+        session (aiohttp.ClientSession): The HTTP session used to fetch listing details.
         title (str): The title of the listing, which may include area and type details.
         location (str): The location information from the listing.
         price (int): The price of the flat.
@@ -210,87 +332,119 @@ def parse_flat(
         image_url (str): URL of the listing image.
 
     Returns:
-        Dict[str, str | int]: A dictionary containing parsed details of the flat listing.
+        FlatListing: The parsed details of the flat listing.
     """
-    logging.info(f"Parsing flat listing with title: {title}")
-    match = re.search(r"(\d+)\s*m²", title)
+    logger.info("Parsing flat listing with title: %s", title)
+    match = _FLAT_AREA_RE.search(title)
     usable_area = int(match.group(1)) if match else None
 
-    flat_type = next((ftype for ftype in VALID_FLAT_TYPES if ftype in title), None)
-
-    extra_details = extract_listing_details(link)
-
-    parsed = {
-        "Title": title,
-        "Property Type": "Flat",
-        "Usable Area (m²)": usable_area,
-        "Flat Type": flat_type,
-        "Location": location,
-        "Region": extra_details["Region"],
-        "District": extra_details["District"],
-        "City": extra_details["City"],
-        "Energy Rank": extra_details["Energy Rank"],
-        "Price (CZK)": price,
-        "URL": link,
-        "Image": image_url,
-    }
-    logging.debug(f"Parsed flat listing: {parsed}")
+    flat_type_match = _FLAT_TYPE_RE.search(title)
+    flat_type = flat_type_match.group(0) if flat_type_match else None
+
+    extra_details = await extract_listing_details(session, link)
+
+    parsed = FlatListing(
+        title=title,
+        property_type="Flat",
+        usable_area=usable_area,
+        flat_type=flat_type,
+        location=location,
+        region=extra_details["Region"],
+        district=extra_details["District"],
+        city=extra_details["City"],
+        energy_rank=extra_details["Energy Rank"],
+        price=price,
+        url=link,
+        image=image_url,
+    )
+    logger.debug("Parsed flat listing: %s", parsed)
     return parsed
 
 
-def parse_listing(
-    listing: BeautifulSoup, estate_type: str
-) -> Optional[Dict[str, str | int]]:
+def parse_listing(listing: LexborNode) -> Optional[Dict[str, str | int]]:
     """
     Parses a single listing HTML element.
 
     Parameters:
-        listing (BeautifulSoup): The BeautifulSoup object representing the listing element.
-        estate_type (str): The type of estate ("byty" or "domy") to determine the parsing method.
+        listing (LexborNode): The parsed node representing the listing element.
 
     Returns:
-        Optional[Dict[str, str | int]]: A dictionary with parsed listing details if successful,
-                                         otherwise None if essential elements are missing.
+        Optional[Dict[str, str | int]]: A dictionary with keys "title", "location", "price",
+                                         "link" and "image_url" if successful, otherwise None
+                                         if essential elements are missing.
     """
-    logging.debug("Parsing individual listing element.")
-    title_tag = listing.select_one("p.css-d7upve")
-    location_tag = listing.select("p.css-d7upve")
-    price_tag = listing.select_one("p.css-ca9wwd")
-    link_tag = listing.select_one("a[href]")
-    img_tag = listing.select_one("img.css-1q0j11k")
-
-    if title_tag and location_tag and price_tag and link_tag:
-        title = title_tag.text.strip()
-        location = location_tag[1].text.strip() if len(location_tag) > 1 else "Unknown"
-        price = clean_price(price_tag.text.strip())
-        link = "https://www.sreality.cz" + link_tag["href"]
-        image_url = "https:" + img_tag["src"] if img_tag else "No image"
-
-        if estate_type == "domy":
-            return parse_house(title, location, price, link, image_url)
-        elif estate_type == "byty":
-            return parse_flat(title, location, price, link, image_url)
-
-    logging.warning("Listing element missing required fields; skipping listing.")
+    logger.debug("Parsing individual listing element.")
+    # The title and the location share a selector, so both come from one query
+    text_tags = listing.css("p.css-d7upve")
+    title_tag = text_tags[0] if text_tags else None
+    location_tag = text_tags[1] if len(text_tags) > 1 else None
+    price_tag = listing.css_first("p.css-ca9wwd")
+    link_tag = listing.css_first("a[href]")
+    img_tag = listing.css_first("img.css-1q0j11k")
+
+    if title_tag and price_tag and link_tag:
+        return {
+            "title": title_tag.text().strip(),
+            "location": location_tag.text().strip() if location_tag else "Unknown",
+            "price": clean_price(price_tag.text().strip()),
+            "link": "https://www.sreality.cz" + (link_tag.attributes.get("href") or ""),
+            "image_url": (
+                "https:" + (img_tag.attributes.get("src") or "")
+                if img_tag
+                else "No image"
+            ),
+        }
+
+    logger.warning("Listing element missing required fields; skipping listing.")
     return None
 
 
-def get_listings(
-    estate_type: str, region: str, page: int
-) -> List[Dict[str, str | int]]:
+def parse_page_html(html: str) -> List[Dict[str, str | int]]:
+    """
+    Parses the listing elements of a search results page.
+
+    Runs in a worker process, so it takes and returns plain picklable data only.
+
+    Parameters:
+        html (str): The HTML of a search results page.
+
+    Returns:
+        List[Dict[str, str | int]]: The fields returned by parse_listing for each complete listing.
+    """
+    tree = LexborHTMLParser(html)
+    parsed_listings = (parse_listing(item) for item in tree.css("ul > li"))
+    return [listing for listing in parsed_listings if listing]
+
+
+async def get_listings(
+    session: aiohttp.ClientSession,
+    executor: Executor,
+    estate_type: str,
+    region: str,
+    page: int,
+) -> Optional[List[Listing]]:
     """
     Fetches listings from Sreality.cz for a given estate type, region, and page number.
 
+    The page is parsed on the executor, then the detail pages of all its listings
+    are fetched concurrently.
+
     Parameters:
+        session (aiohttp.ClientSession): The HTTP session used for the requests.
+        executor (Executor): The executor that parses the page HTML.
         estate_type (str): The type of estate to fetch (e.g., "byty", "domy").
         region (str): The region from which to fetch listings, or "all" for all regions.
         page (int): The page number to scrape.
 
     Returns:
-        List[Dict[str, str | int]]: A list of dictionaries, each representing a listing.
+        Optional[List[Listing]]: The parsed listings of the page, or None if the page
+                                 could not be retrieved.
     """
-    logging.info(
-        f"Fetching listings from page {page} for estate_type={estate_type} and region={region}"
+    logger.info(
+        "Fetching listings from page %s for estate_type=%s and region=%s",
+        page,
+        estate_type,
+        region,
     )
     url = (
         f"https://www.sreality.cz/hledani/prodej/{estate_type}/{region}?page={page}"
@@ -298,70 +452,122 @@ def get_listings(
         else f"https://www.sreality.cz/hledani/prodej/{estate_type}?page={page}"
     )
 
-    response = requests.get(url, headers=HEADERS)
-
-    if response.status_code != 200:
-        logging.error(
-            f"Failed to retrieve data from {url} (Status Code: {response.status_code})"
-        )
-        print(f"Failed to retrieve data (Status Code: {response.status_code})")
-        return []
+    status, html = await fetch_html(session, url)
+    if status != 200:
+        logger.error("Failed to retrieve data from %s (Status Code: %s)", url, status)
+        print(f"❌ Page {page} could not be retrieved (Status Code: {status})")
+        return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    listings = []
+    loop = asyncio.get_running_loop()
+    page_listings = await loop.run_in_executor(executor, parse_page_html, html)
 
-    for item in soup.select("ul > li"):
-        parsed_listing = parse_listing(item, estate_type)
-        if parsed_listing:
-            listings.append(parsed_listing)
+    parse_estate = parse_house if estate_type == "domy" else parse_flat
+    listings = await asyncio.gather(
+        *(parse_estate(session, **listing) for listing in page_listings)
+    )
 
-    logging.info(f"Page {page} fetched with {len(listings)} listings.")
+    logger.info("Page %s fetched with %s listings.", page, len(listings))
     return listings
 
 
-def scrape_multiple_pages(
-    estate_type: str, region: str, pages: int
-) -> List[Dict[str, str | int]]:
+async def scrape_multiple_pages(
+    estate_type: str,
+    region: str,
+    pages: int,
+    on_listing: Callable[[Listing], None],
+) -> int:
     """
-    Scrapes multiple pages of listings using parallel threads.
+    Scrapes multiple pages of listings concurrently over a shared HTTP session.
+
+    Pages are requested in batches of PAGE_BATCH_SIZE, and no further batches are
+    scheduled once a page comes back without listings. Search result pages are
+    parsed in a process pool, leaving the event loop free for network I/O.
+
+    Listings are handed to on_listing as soon as their page has been scraped,
+    so the full result set is never held in memory.
 
     Parameters:
         estate_type (str): The type of estate to scrape (e.g., "byty", "domy").
         region (str): The region to scrape listings from, or "all" for all regions.
         pages (int): The total number of pages to scrape.
+        on_listing (Callable[[Listing], None]): Called with each scraped listing.
 
     Returns:
-        List[Dict[str, str | int]]: A list of dictionaries, each representing a listing from all scraped pages.
+        int: The total number of listings scraped from all pages.
     """
-    logging.info(
-        f"Starting to scrape {pages} pages for estate_type={estate_type} and region={region}"
+    logger.info(
+        "Starting to scrape %s pages for estate_type=%s and region=%s",
+        pages,
+        estate_type,
+        region,
     )
-    all_listings = []
-    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
-        futures = {
-            executor.submit(get_listings, estate_type, region, page): page
-            for page in range(1, pages + 1)
-        }
 
-        for future in as_completed(futures):
-            page_num = futures[future]
-            try:
-                listings = future.result()
-                if listings:
-                    all_listings.extend(listings)
-                    print(f"✅ Page {page_num} scraped successfully")
-                    logging.info(
-                        f"Page {page_num} scraped successfully with {len(listings)} listings."
-                    )
-                else:
-                    print(f"⚠️ Page {page_num} returned no listings")
-                    logging.warning(f"Page {page_num} returned no listings.")
-            except Exception as e:
-                print(f"❌ Error scraping page {page_num}: {e}")
-                logging.error(f"Error scraping page {page_num}: {e}")
+    async def scrape_page(
+        session: aiohttp.ClientSession, executor: Executor, page_num: int
+    ) -> Optional[int]:
+        try:
+            listings = await get_listings(
+                session, executor, estate_type, region, page_num
+            )
+        except Exception as e:
+            print(f"❌ Error scraping page {page_num}: {e}")
+            logger.error("Error scraping page %s: %s", page_num, e)
+            return None
+
+        if listings is None:
+            return None
+
+        if not listings:
+            print(f"⚠️ Page {page_num} returned no listings")
+            logger.warning("Page %s returned no listings.", page_num)
+            return 0
+
+        for listing in listings:
+            on_listing(listing)
+        print(f"✅ Page {page_num} scraped successfully")
+        logger.info(
+            "Page %s scraped successfully with %s listings.", page_num, len(listings)
+        )
+        return len(listings)
 
-    logging.info(f"Scraping completed. Total listings scraped: {len(all_listings)}")
-    return all_listings
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT, keepalive_timeout=KEEPALIVE_TIMEOUT
+    )
+    # Per-socket limits only: a total timeout would also count time spent queued
+    # for a free connection in the pool
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT
+    )
+    # Workers start lazily on the first submit, when the event loop's threads already
+    # exist; spawn them instead of forking a multi-threaded process
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        async with aiohttp.ClientSession(
+            headers=HEADERS, connector=connector, timeout=timeout
+        ) as session:
+            total = 0
+            for batch_start in range(1, pages + 1, PAGE_BATCH_SIZE):
+                batch = range(
+                    batch_start, min(batch_start + PAGE_BATCH_SIZE, pages + 1)
+                )
+                counts = await asyncio.gather(
+                    *(scrape_page(session, executor, page) for page in batch)
+                )
+                total += sum(count for count in counts if count)
+
+                # Failed pages (None) may be transient; only an empty page ends the results
+                if 0 in counts:
+                    if batch.stop <= pages:
+                        logger.info(
+                            "Reached the last page of results; skipping pages %s-%s.",
+                            batch.stop,
+                            pages,
+                        )
+                    break
+
+    logger.info("Scraping completed. Total listings scraped: %s", total)
+    return total
 
 
 if __name__ == "__main__":
@@ -375,26 +581,47 @@ if __name__ == "__main__":
         estate_type, region, num_pages = validate_args(
             sys.argv[1], sys.argv[2], sys.argv[3]
         )
-        logging.info(
-            f"Arguments received and validated: estate_type={estate_type}, region={region}, num_pages={num_pages}"
+        logger.info(
+            "Arguments received and validated: estate_type=%s, region=%s, num_pages=%s",
+            estate_type,
+            region,
+            num_pages,
         )
         print(f"Scraping {num_pages} pages of {estate_type} in {region}...")
 
-        data = scrape_multiple_pages(estate_type, region, num_pages)
-
-        if data:
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"sreality_{estate_type}_{region}_{timestamp}.csv"
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        filename = f"sreality_{estate_type}_{region}_{timestamp}.csv"
+        listing_type = HouseListing if estate_type == "domy" else FlatListing
+        listing_fields = fields(listing_type)
+
+        try:
+            with open(filename, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow([f.metadata["column"] for f in listing_fields])
+                # Pull each row's values out in column order in a single C-level call
+                row_values = attrgetter(*(f.name for f in listing_fields))
+                total = asyncio.run(
+                    scrape_multiple_pages(
+                        estate_type,
+                        region,
+                        num_pages,
+                        lambda listing: writer.writerow(row_values(listing)),
+                    )
+                )
+        except BaseException:
+            # Don't leave a header-only or partial CSV behind
+            os.remove(filename)
+            raise
 
-            df = pd.DataFrame(data)
-            df.to_csv(filename, index=False, encoding="utf-8")
+        if total:
             print(f"✅ Data saved to {filename}")
-            logging.info(f"Data saved to {filename}")
+            logger.info("Data saved to %s", filename)
         else:
+            os.remove(filename)
             print("❌ No data found.")
-            logging.warning("No data found to save.")
+            logger.warning("No data found to save.")
     except ValueError as e:
-        logging.exception(
+        logger.exception(
             "An error occurred while validating arguments or scraping data."
         )
         print(e)